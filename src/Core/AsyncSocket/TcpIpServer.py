@@ -17,6 +17,7 @@ class TcpIpServer(TcpIpObject):
                  nb_client: int = 5,
                  max_client_count: int = 10,
                  batch_size: int = 5,
+                 prefetch_factor: int = 0,
                  manager: Optional[Any] = None):
         """
         TcpIpServer is used to communicate with clients associated with Environment to produce batches for the
@@ -27,6 +28,10 @@ class TcpIpServer(TcpIpObject):
         :param nb_client: Number of expected client connections.
         :param max_client_count: Maximum number of allowed clients.
         :param batch_size: Number of samples in a batch.
+        :param prefetch_factor: Number of samples per client that can be produced in advance for the next batches. Only
+                                the clients that would be idle in the last round of a batch produce samples in
+                                advance, so nothing is produced in advance if the batch size is a multiple of the
+                                number of clients.
         :param manager: EnvironmentManager that handles the TcpIpServer.
         """
 
@@ -52,6 +57,9 @@ class TcpIpServer(TcpIpObject):
         self.batch_from_dataset: Optional[List[int]] = None
         self.first_time: bool = True
         self.data_lines: List[List[int]] = []
+        self.prefetched_lines: List[List[int]] = []
+        self.produced_lines: List[List[int]] = []
+        self.max_prefetched_lines: int = prefetch_factor * self.nb_client
 
         # Reference to EnvironmentManager
         self.environment_manager: Optional[Any] = manager
@@ -230,17 +238,39 @@ class TcpIpServer(TcpIpObject):
         :param animate: If True, triggers an environment step
         """
 
-        nb_sample = 0
+        # Samples can only be produced in advance when they are not given by the Dataset
+        prefetch = animate and self.batch_from_dataset is None
+
+        # Use the samples produced in advance first
         self.data_lines = []
+        if prefetch:
+            self.data_lines = self.prefetched_lines[:self.batch_size]
+            self.prefetched_lines = self.prefetched_lines[self.batch_size:]
+        nb_sample = nb_prefetched = len(self.data_lines)
+
         # Launch the communication protocol while the batch needs to be filled
         while nb_sample < self.batch_size:
-            clients = self.clients[:min(len(self.clients), self.batch_size - nb_sample)]
+            # Every client is used if the extra samples can be kept for the next batches
+            nb_extra = len(self.clients) - (self.batch_size - nb_sample)
+            if prefetch and 0 < nb_extra and len(self.prefetched_lines) + nb_extra <= self.max_prefetched_lines:
+                clients = self.clients
+            else:
+                clients = self.clients[:min(len(self.clients), self.batch_size - nb_sample)]
             # Run communicate protocol for each client and wait for the last one to finish
             await gather(*[self.__communicate(client=client,
                                               client_id=client_id,
                                               animate=animate) for client_id, client in clients])
             nb_sample += len(clients)
 
+        # Every sample produced by this request is already stored in the current partition, including the ones kept
+        # for the next batches, so they must be added to the Database with this batch
+        self.produced_lines = self.data_lines[nb_prefetched:]
+
+        # Keep the extra samples for the next batches
+        if prefetch:
+            self.prefetched_lines += self.data_lines[self.batch_size:]
+            self.data_lines = self.data_lines[:self.batch_size]
+
     async def __communicate(self,
                             client: Optional[socket] = None,
                             client_id: Optional[int] = None,
@@ -1,5 +1,5 @@
 from typing import Union, List, Dict, Any, Callable, Optional, Type, Tuple
-from numpy import array, where
+from numpy import where, unique, asarray, argsort, searchsorted, empty, ndarray
 from itertools import chain
 
 from SSD.Core.Storage.Database import Database
@@ -36,7 +36,7 @@ class DatabaseHandler:
 
     def init(self,
              storing_partitions: List[Database],
-             exchange_db: Database) -> None:
+             exchange_db: Optional[Database]) -> None:
         """
         Initialize the list of the partitions.
 
@@ -97,6 +97,30 @@ class DatabaseHandler:
         if self.__exchange_db is not None:
             self.__exchange_db.load()
 
+    def open_copy(self) -> 'DatabaseHandler':
+        """
+        Open a new DatabaseHandler on the same storing partitions. Connections to the Databases cannot be shared between
+        threads, so a thread reading the partitions must use its own copy, created within this thread.
+        """
+
+        handler = DatabaseHandler()
+        handler.init(storing_partitions=[Database(database_dir=partition.get_path()[0],
+                                                  database_name=partition.get_path()[1]).load()
+                                         for partition in self.__storing_partitions],
+                     exchange_db=None)
+        return handler
+
+    def close(self) -> None:
+        """
+        Close the Databases opened by this DatabaseHandler. Only for copies created with 'open_copy', the Databases of
+        other DatabaseHandlers are closed by the DatabaseManager.
+        """
+
+        for db in self.__storing_partitions:
+            db.close()
+        if self.__exchange_db is not None:
+            self.__exchange_db.close()
+
     def get_database_dir(self) -> str:
         """
         Get the database repository of the session.
@@ -252,7 +276,7 @@ class DatabaseHandler:
         """
 
         # Transform list of lines to batch of lines per partition
-        batch_indices = array(lines_id)
+        batch_indices = asarray(lines_id)
         partition_batch_indices = []
         for i in range(len(self.__storing_partitions)):
             partition_indices = where(batch_indices[:, 0] == i)[0]
@@ -277,3 +301,45 @@ class DatabaseHandler:
                             [list(chain.from_iterable([partition_batches[i][key]
                                                        for i in range(len(partition_batches))]))
                              for key in partition_batches[0].keys()]))
+
+    def get_lines_as_arrays(self,
+                            table_name: str,
+                            lines_id: List[List[int]],
+                            fields: Union[str, List[str]],
+                            dtype: Optional[str] = None) -> Dict[str, ndarray]:
+        """
+        Get lines of data from a Database as contiguous arrays, in the order of the given indices.
+
+        :param table_name: Name of the Table.
+        :param lines_id: Indices of the lines to get.
+        :param fields: Data fields to extract.
+        :param dtype: Type of the arrays.
+        """
+
+        fields = [fields] if type(fields) == str else fields
+        batch_indices = asarray(lines_id)
+        batch = {}
+
+        # One request per partition, written directly at the position of the lines in the batch
+        for partition_id in unique(batch_indices[:, 0]):
+            positions = where(batch_indices[:, 0] == partition_id)[0]
+            lines = batch_indices[positions, 1]
+            data = self.__storing_partitions[partition_id].get_lines(table_name=table_name,
+                                                                     lines_id=lines.tolist(),
+                                                                     fields=fields,
+                                                                     batched=True)
+            # Lines are not necessarily returned in the requested order, nor repeated if requested several times
+            ids = asarray(data['id'], dtype=int)
+            order = argsort(ids)
+            rows = order[searchsorted(ids[order], lines).clip(max=len(ids) - 1)] if len(ids) > 0 else None
+            if rows is None or (ids[rows] != lines).any():
+                missing = sorted(set(lines.tolist()) - set(ids.tolist()))
+                raise IndexError(f"[{self.__class__.__name__}] The lines {missing} of the partition n°{partition_id} "
+                                 f"do not exist in the Table '{table_name}'.")
+            for field in fields:
+                values = asarray(data[field], dtype=dtype)
+                if field not in batch:
+                    batch[field] = empty((len(batch_indices),) + values.shape[1:], dtype=values.dtype)
+                batch[field][positions] = values[rows]
+
+        return batch
@@ -39,6 +39,7 @@ class BaseEnvironment(AbstractEnvironment):
         self.sample_training: Optional[Dict[str, Any]] = None
         self.sample_additional: Optional[Dict[str, Any]] = None
         self.__first_add: List[bool] = [True, True]
+        self.__exchange_fields: Optional[List[str]] = None
 
         # Connect the Environment to the data Database
         self.__database_handler = DatabaseHandler(on_init_handler=self.__database_handler_init)
@@ -247,7 +248,7 @@ class BaseEnvironment(AbstractEnvironment):
                 raise ValueError(f"[{self.name}] The prediction request requires the network fields.")
             self.__database_handler.load()
             self.__first_add[1] = False
-            required_fields = list(set(self.__database_handler.get_fields(table_name='Exchange')) - {'id'})
+            required_fields = list(set(self.__get_exchange_fields()) - {'id'})
             for field in kwargs.keys():
                 if field not in required_fields:
                     raise ValueError(f"[{self.name}] The field '{field}' is not in the training Database."
@@ -255,7 +256,7 @@ class BaseEnvironment(AbstractEnvironment):
 
         # Avoid empty sample
         if len(kwargs) == 0:
-            required_fields = set(self.__database_handler.get_fields(table_name='Exchange')) - {'id'}
+            required_fields = set(self.__get_exchange_fields()) - {'id'}
             necessary_fields = list(required_fields.intersection(self.__data_training.keys()))
             kwargs = {field: self.__data_training[field] for field in necessary_fields}
 
@@ -288,6 +289,19 @@ class BaseEnvironment(AbstractEnvironment):
         if self.factory is not None:
             self.factory.render()
 
+    def __get_exchange_fields(self) -> List[str]:
+        """
+        Get the Fields of the Exchange Database. They are defined once by the NetworkManager for all the Environments,
+        so they are only requested until the Network Fields are created.
+        """
+
+        if self.__exchange_fields is None:
+            fields = self.__database_handler.get_fields(table_name='Exchange')
+            if len(fields) <= 1:
+                return fields
+            self.__exchange_fields = fields
+        return self.__exchange_fields
+
     def _get_prediction(self):
         """
         Request a prediction from Network and apply it to the Environment.
@@ -295,7 +309,7 @@ class BaseEnvironment(AbstractEnvironment):
         """
 
         training_data = self.__data_training.copy()
-        required_fields = self.__database_handler.get_fields(table_name='Exchange')
+        required_fields = self.__get_exchange_fields()
         for field in self.__data_training.keys():
             if field not in required_fields:
                 del training_data[field]
@@ -24,14 +24,16 @@ class BaseEnvironmentConfig:
                  always_produce: bool = False,
                  visualizer: Optional[str] = None,
                  record_wrong_samples: bool = False,
-                 env_kwargs: Optional[Dict[str, Any]] = None):
+                 env_kwargs: Optional[Dict[str, Any]] = None,
+                 prefetch_factor: int = 0):
         """
         BaseEnvironmentConfig is a configuration class to parameterize and create a BaseEnvironment for the
         EnvironmentManager.
 
         :param environment_class: Class from which an instance will be created.
         :param as_tcp_ip_client: Environment is owned by a TcpIpClient if True, by an EnvironmentManager if False.
-        :param number_of_thread: Number of thread to run.
+        :param number_of_thread: Number of thread to run. More Environments keep the Network busier, but too many of
+                                 them compete for the CPU with the training itself.
         :param ip_address: IP address of the TcpIpObject.
         :param port: Port number of the TcpIpObject.
         :param simulations_per_step: Number of iterations to compute in the Environment at each time step.
@@ -43,6 +45,10 @@ class BaseEnvironmentConfig:
         :param visualizer: Backend of the Visualizer to use.
         :param record_wrong_samples: If True, wrong samples are recorded through Visualizer.
         :param env_kwargs: Additional arguments to pass to the Environment.
+        :param prefetch_factor: Number of samples per TcpIpClient that can be produced in advance for the next batches
+                                of the training Pipeline. Only the TcpIpClients that would be idle in the last round
+                                of a batch produce samples in advance, so nothing is produced in advance if the batch
+                                size is a multiple of number_of_thread (e.g. with a single thread).
         """
 
         self.name: str = self.__class__.__name__
@@ -53,6 +59,11 @@ class BaseEnvironmentConfig:
                             f"{type(simulations_per_step)}")
         if simulations_per_step < 1:
             raise ValueError(f"[{self.name}] Given simulations_per_step value is negative or null")
+        # Check prefetch_factor type and value
+        if type(prefetch_factor) != int:
+            raise TypeError(f"[{self.name}] Wrong prefetch_factor type: int required, get {type(prefetch_factor)}")
+        if prefetch_factor < 0:
+            raise ValueError(f"[{self.name}] Given prefetch_factor value is negative")
         # Check max_wrong_samples_per_step type and value
         if type(max_wrong_samples_per_step) != int:
             raise TypeError(f"[{self.name}] Wrong max_wrong_samples_per_step type: int required, get "
@@ -79,6 +90,7 @@ class BaseEnvironmentConfig:
         self.port: int = port
         self.server_is_ready: bool = False
         self.max_client_connections: int = 100
+        self.prefetch_factor: int = prefetch_factor
 
         # EnvironmentManager variables
         self.simulations_per_step: int = simulations_per_step
@@ -95,22 +107,26 @@ class BaseEnvironmentConfig:
     def create_server(self,
                       environment_manager: Optional[Any] = None,
                       batch_size: int = 1,
-                      visualization_db: Optional[Tuple[str, str]] = None) -> TcpIpServer:
+                      visualization_db: Optional[Tuple[str, str]] = None,
+                      pipeline: str = '') -> TcpIpServer:
         """
         Create a TcpIpServer and launch TcpIpClients in subprocesses.
 
         :param environment_manager: EnvironmentManager.
         :param batch_size: Number of sample in a batch.
         :param visualization_db: Path to the visualization Database to connect to.
+        :param pipeline: Type of the Pipeline.
         :return: TcpIpServer object.
         """
 
-        # Create server
+        # Create server, samples are only produced in advance for the training Pipeline where they are then added with
+        # the batch they belong to
         server = TcpIpServer(ip_address=self.ip_address,
                              port=self.port,
                              nb_client=self.number_of_thread,
                              max_client_count=self.max_client_connections,
                              batch_size=batch_size,
+                             prefetch_factor=self.prefetch_factor if pipeline == 'training' else 0,
                              manager=environment_manager)
         server_thread = Thread(target=self.start_server, args=(server, visualization_db))
         server_thread.start()
@@ -176,6 +192,7 @@ class BaseEnvironmentConfig:
         description += f"{self.name}\n"
         description += f"    Environment class: {self.environment_class.__name__}\n"
         description += f"    Simulations per step: {self.simulations_per_step}\n"
+        description += f"    Prefetch factor: {self.prefetch_factor}\n"
         description += f"    Max wrong samples per step: {self.max_wrong_samples_per_step}\n"
         description += f"    Always create data: {self.only_first_epoch}\n"
         return description
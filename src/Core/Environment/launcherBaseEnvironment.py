@@ -1,6 +1,7 @@
-from os import sep
 from os.path import dirname
 from sys import argv, path
+from pathlib import Path
+from importlib import import_module
 
 from DeepPhysX.Core.Environment.BaseEnvironment import BaseEnvironment as Environment
 from DeepPhysX.Core.AsyncSocket.TcpIpClient import TcpIpClient
@@ -15,8 +16,7 @@ if __name__ == '__main__':
 
     # Import environment_class
     path.append(dirname(argv[1]))
-    module_name = argv[1].split(sep)[-1][:-3]
-    exec(f"from {module_name} import {argv[2]} as Environment")
+    Environment = getattr(import_module(Path(argv[1]).stem), argv[2])
 
     # Create, init and run Tcp-Ip environment
     client = TcpIpClient(environment=Environment,
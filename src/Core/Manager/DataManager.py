@@ -111,7 +111,9 @@ class DataManager:
             if self.environment_manager is not None and self.produce_data and \
                     (epoch == 0 or self.environment_manager.always_produce):
                 self.data_lines = self.environment_manager.get_data(animate=animate)
-                self.database_manager.add_data(self.data_lines)
+                # Samples produced in advance are added with this batch, while they are in the current partition
+                produced_lines = self.environment_manager.produced_lines
+                self.database_manager.add_data(produced_lines if len(produced_lines) > 0 else None)
 
             # Get data from Dataset
             else:
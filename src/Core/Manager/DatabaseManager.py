@@ -3,7 +3,7 @@ from os.path import isfile, isdir, join
 from os import listdir, symlink, sep, remove, rename, makedirs
 from json import dump as json_dump
 from json import load as json_load
-from numpy import arange, ndarray, array, abs, mean, sqrt, empty, concatenate
+from numpy import arange, ndarray, asarray, abs, mean, sqrt, empty, concatenate
 from numpy.random import shuffle
 
 from SSD.Core.Storage.Database import Database
@@ -517,7 +517,7 @@ class DatabaseManager:
             data_to_normalize = self.load_partitions_fields(partition=partition, fields=fields)
             nb_samples.append(data_to_normalize['id'][-1])
             for field in fields:
-                data = array(data_to_normalize[field])
+                data = asarray(data_to_normalize[field])
                 means[field].append(data.mean())
         # 2.2. Compute the global mean
         for field in fields:
@@ -531,7 +531,7 @@ class DatabaseManager:
             data_to_normalize = self.load_partitions_fields(partition=partition,
                                                             fields=fields)
             for field in fields:
-                data = array(data_to_normalize[field])
+                data = asarray(data_to_normalize[field])
                 stds[field].append(mean(abs(data - normalization[field][0]) ** 2))
         # 3.2. Compute the global standard deviation
         for field in fields:
@@ -563,7 +563,7 @@ class DatabaseManager:
                                                                      lines_id=data_lines,
                                                                      batched=True)
         for field in fields:
-            data = array(data_to_normalize[field])
+            data = asarray(data_to_normalize[field])
             m = (previous_nb_samples / self.total_nb_sample) * previous_normalization[field][0] + \
                 (len(data_lines) / self.total_nb_sample) * data.mean()
             new_normalization[field][0] = m
@@ -577,7 +577,7 @@ class DatabaseManager:
                                                             fields=fields)
             nb_samples.append(data_to_normalize['id'][-1])
             for field in fields:
-                data = array(data_to_normalize[field])
+                data = asarray(data_to_normalize[field])
                 stds[field].append(mean(abs(data - new_normalization[field][0]) ** 2))
         # 3.2. Compute the global standard deviation
         for field in fields:
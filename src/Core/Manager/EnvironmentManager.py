@@ -41,6 +41,7 @@ class EnvironmentManager:
         self.max_wrong_samples_per_step: int = environment_config.max_wrong_samples_per_step
         self.allow_prediction_requests: bool = pipeline != 'data_generation'
         self.dataset_batch: Optional[List[List[int]]] = None
+        self.produced_lines: List[List[int]] = []
 
         # Create a Visualizer to provide the visualization Database
         force_local = pipeline == 'prediction'
@@ -60,7 +61,8 @@ class EnvironmentManager:
             self.server = environment_config.create_server(environment_manager=self,
                                                            batch_size=batch_size,
                                                            visualization_db=None if visualizer_db is None else
-                                                           visualizer_db.get_path())
+                                                           visualizer_db.get_path(),
+                                                           pipeline=pipeline)
             if visualizer_db is not None:
                 visualizer_db.remove_table(table_name='Temp')
                 Visualizer.launch(backend=environment_config.visualizer,
@@ -123,7 +125,10 @@ class EnvironmentManager:
         :param animate: If True, triggers an environment step.
         """
 
-        return self.server.get_batch(animate)
+        data_lines = self.server.get_batch(animate)
+        # Samples produced in advance for the next batches are also stored in the Database
+        self.produced_lines = self.server.produced_lines
+        return data_lines
 
     def __get_data_from_environment(self,
                                     animate: bool = True,
@@ -174,6 +179,7 @@ class EnvironmentManager:
                 # 3.3. Rest the data variables
                 self.environment._reset_training_data()
 
+        self.produced_lines = dataset_lines
         return dataset_lines
 
     def __dispatch_batch_to_server(self,
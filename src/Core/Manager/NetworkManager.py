@@ -1,11 +1,16 @@
-from typing import Any, Dict, Optional, List
-from os import listdir
-from os.path import join, isdir, isfile, sep
-from numpy import ndarray, array
+from typing import Any, Dict, Optional, List, Tuple
+from os import scandir
+from re import fullmatch
+from os.path import join, isdir, sep
+from concurrent.futures import ThreadPoolExecutor, Future
+from numpy import ndarray, asarray, empty, subtract, multiply, add, cumsum, dtype, result_type, issubdtype, inexact, \
+    float64, can_cast
 
 from DeepPhysX.Core.Database.DatabaseHandler import DatabaseHandler
 from DeepPhysX.Core.Network.BaseNetworkConfig import BaseNetworkConfig
+from DeepPhysX.Core.Network.BaseNetwork import BaseNetwork
 from DeepPhysX.Core.Utils.path import copy_dir, create_dir
+from DeepPhysX.Core.Utils.logger import get_logger
 
 
 class NetworkManager:
@@ -26,6 +31,7 @@ class NetworkManager:
         """
 
         self.name: str = self.__class__.__name__
+        self.logger = get_logger(self.name)
 
         # Storage variables
         self.database_handler: DatabaseHandler = DatabaseHandler()
@@ -37,9 +43,23 @@ class NetworkManager:
         self.saved_counter: int = 0
         self.save_each_epoch: bool = network_config.save_each_epoch
 
+        # Training data preloaded in memory
+        self.preload_max_size: Optional[float] = network_config.preload_max_size
+        self.__preloaded_batch: Optional[Dict[str, ndarray]] = None
+        self.__preloaded_normalization: Optional[Dict[str, List[float]]] = None
+        self.__preloaded_offsets: Optional[ndarray] = None
+
+        # Normalization coefficients cast once to the data type as (mean, std, 1 / std) for each field
+        self.__normalization: Optional[Dict[str, List[float]]] = None
+        self.__normalization_coefficients: Dict[str, Tuple[ndarray, ndarray, ndarray]] = {}
+
         # Init Network
         self.network = network_config.create_network()
         self.network.set_device()
+        self.network.set_matmul_precision()
+        if self.network.config.mixed_precision and type(self.network).autocast is BaseNetwork.autocast:
+            self.logger.warning(f"[{self.name}] 'mixed_precision' is set but {self.network.__class__.__name__} does "
+                                f"not implement 'autocast', the option is ignored.")
         if pipeline == 'training' and not network_config.training_stuff:
             raise ValueError(f"[{self.name}] Training requires a loss and an optimizer in your NetworkConfig")
         self.is_training: bool = pipeline == 'training'
@@ -52,6 +72,12 @@ class NetworkManager:
         # Init DataTransformation
         self.data_transformation = network_config.create_data_transformation()
 
+        # Intermediate saves are written by a background thread if the Network can write a copy of its parameters
+        self.__save_pool: Optional[ThreadPoolExecutor] = None
+        self.__save_future: Optional[Future] = None
+        if type(self.network).write_parameters is not BaseNetwork.write_parameters:
+            self.__save_pool = ThreadPoolExecutor(max_workers=1)
+
         # Training configuration
         if self.is_training:
             self.network.set_train()
@@ -71,6 +97,13 @@ class NetworkManager:
             self.network_dir = join(session, 'network/')
             self.load_network(which_network=network_config.which_network)
 
+        # Compile the forward pass once the parameters are set
+        if self.network.config.use_compile:
+            if type(self.network).compile_forward is BaseNetwork.compile_forward:
+                self.logger.warning(f"[{self.name}] 'use_compile' is set but {self.network.__class__.__name__} does "
+                                    f"not implement 'compile_forward', the option is ignored.")
+            self.network.compile_forward()
+
     ##########################################################################################
     ##########################################################################################
     #                              DatabaseHandler management                                #
@@ -114,13 +147,17 @@ class NetworkManager:
         :param which_network: If several sets of parameters were saved, specify which one to load.
         """
 
-        # 1. Get the list of all sets of saved parameters
-        networks_list = [join(self.network_dir, f) for f in listdir(self.network_dir) if
-                         isfile(join(self.network_dir, f)) and f.__contains__('network_')]
-        networks_list = sorted(networks_list)
-        last_saved_network = [join(self.network_dir, f) for f in listdir(self.network_dir) if
-                              isfile(join(self.network_dir, f)) and f.__contains__('network.')]
-        networks_list = networks_list + last_saved_network
+        # 1. Get the list of all sets of saved parameters with a single scan of the repository
+        networks_list, last_saved_network = [], []
+        with scandir(self.network_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    # Final save is 'network.<ext>', intermediate saves are '<session>_network_<id>.<ext>'
+                    if fullmatch(r'network\.[^.]+', entry.name):
+                        last_saved_network.append(entry.path)
+                    elif (match := fullmatch(r'.+_network_(\d+)\.[^.]+', entry.name)) is not None:
+                        networks_list.append((int(match.group(1)), entry.path))
+        networks_list = [path for _, path in sorted(networks_list)] + last_saved_network
 
         # 2. Check the Network to access
         if len(networks_list) == 0:
@@ -128,12 +165,12 @@ class NetworkManager:
         elif len(networks_list) == 1:
             which_network = 0
         elif which_network > len(networks_list):
-            print(f"[{self.name}] The network 'network_{self.saved_counter} doesn't exist, loading the most trained "
-                  f"by default.")
+            self.logger.warning(f"[{self.name}] The network 'network_{self.saved_counter} doesn't exist, loading the "
+                                f"most trained by default.")
             which_network = -1
 
         # 3. Load the set of parameters
-        print(f"[{self.name}]: Loading network from {networks_list[which_network]}.")
+        self.logger.info(f"[{self.name}]: Loading network from {networks_list[which_network]}.")
         self.network.load_parameters(networks_list[which_network])
 
     def save_network(self,
@@ -146,16 +183,33 @@ class NetworkManager:
 
         # Final session saving
         if last_save:
+            self.wait_saves()
             path = join(self.network_dir, 'network')
-            print(f"[{self.name}] Saving final network at {self.network_dir}.")
+            self.logger.info(f"[{self.name}] Saving final network at {self.network_dir}.")
             self.network.save_parameters(path)
 
         # Intermediate states saving
         elif self.save_each_epoch:
-            path = self.network_dir + self.network_template_name.format(self.saved_counter)
+            path = join(self.network_dir, self.network_template_name.format(self.saved_counter))
             self.saved_counter += 1
-            print(f"[{self.name}] Saving intermediate network at {path}.")
-            self.network.save_parameters(path)
+            self.logger.info(f"[{self.name}] Saving intermediate network at {path}.")
+            if self.__save_pool is None:
+                self.network.save_parameters(path)
+            # Write a copy of the parameters in the background thread, training can go on meanwhile
+            else:
+                self.wait_saves()
+                self.__save_future = self.__save_pool.submit(self.network.write_parameters,
+                                                             self.network.copy_parameters(),
+                                                             path)
+
+    def wait_saves(self) -> None:
+        """
+        Wait for the pending intermediate save to be written, errors of the background thread are raised here.
+        """
+
+        if self.__save_future is not None:
+            future, self.__save_future = self.__save_future, None
+            future.result()
 
     ##########################################################################################
     ##########################################################################################
@@ -163,45 +217,127 @@ class NetworkManager:
     ##########################################################################################
     ##########################################################################################
 
+    def preload_data(self,
+                     normalization: Optional[Dict[str, List[float]]] = None) -> bool:
+        """
+        Load and normalize all the training samples once if the Dataset is small enough, so that batches are then
+        selected in memory instead of being read from the Database. Only valid while the Database is not edited.
+
+        :param normalization: Normalization coefficients.
+        :return: True if the samples were preloaded.
+        """
+
+        if self.preload_max_size is None:
+            return False
+
+        # 1. Get the number of samples in each partition
+        nb_lines = [partition.nb_lines(table_name='Training') for partition in self.database_handler.get_partitions()]
+        if sum(nb_lines) == 0:
+            return False
+
+        # 2. Estimate the size of the Dataset from the first sample
+        fields = list(dict.fromkeys(self.network.net_fields + self.network.opt_fields))
+        sample = self.database_handler.get_line(table_name='Training',
+                                                line_id=[[i for i, n in enumerate(nb_lines) if n > 0][0], 1],
+                                                fields=fields)
+        sample_size = sum([asarray(sample[field]).size for field in fields])
+        if sum(nb_lines) * sample_size * dtype(self.network.config.data_type).itemsize > self.preload_max_size * 1e9:
+            return False
+
+        # 3. Load and normalize the whole Dataset
+        coefficients = self.get_normalization_coefficients(normalization)
+        batch = self.database_handler.get_lines_as_arrays(table_name='Training',
+                                                          fields=fields,
+                                                          lines_id=[[i, line] for i, n in enumerate(nb_lines)
+                                                                    for line in range(1, n + 1)],
+                                                          dtype=self.network.config.data_type)
+        for field in batch.keys():
+            if field in coefficients:
+                batch[field] = self.__apply_normalization(data=batch[field],
+                                                          coefficients=coefficients[field],
+                                                          out=batch[field])
+        self.__preloaded_batch = batch
+        self.__preloaded_normalization = normalization
+        self.__preloaded_offsets = cumsum([0] + nb_lines[:-1])
+        return True
+
+    def prepare_batch(self,
+                      data_lines: List[List[int]],
+                      normalization: Optional[Dict[str, List[float]]] = None,
+                      grad: bool = True,
+                      database_handler: Optional[DatabaseHandler] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Get a batch from the Database, normalize it and convert it to tensors for the Network and the Optimization.
+
+        :param data_lines: Batch of indices of samples in the Database.
+        :param normalization: Normalization coefficients.
+        :param grad: If True, gradient will record operations on the tensors.
+        :param database_handler: DatabaseHandler to read the batch with, required when called from another thread.
+        :return: Network data and Optimization data.
+        """
+
+        net_fields, opt_fields = self.network.net_fields, self.network.opt_fields
+        fields = list(dict.fromkeys(net_fields + opt_fields))
+
+        # Select the batch in the preloaded samples, already normalized
+        if self.__preloaded_batch is not None and normalization is self.__preloaded_normalization:
+            indices = asarray(data_lines)
+            rows = self.__preloaded_offsets[indices[:, 0]] + indices[:, 1] - 1
+            batch = {field: self.__preloaded_batch[field][rows] for field in fields}
+
+        else:
+            # Get the whole batch from the Database with a single request, fields shared by the Network and the
+            # Optimization are read, normalized and converted once then used by both sides
+            coefficients = self.get_normalization_coefficients(normalization)
+            database_handler = self.database_handler if database_handler is None else database_handler
+            batch = database_handler.get_lines_as_arrays(table_name='Training',
+                                                         fields=fields,
+                                                         lines_id=data_lines,
+                                                         dtype=self.network.config.data_type)
+            # Apply normalization in place
+            for field in batch.keys():
+                if field in coefficients:
+                    batch[field] = self.__apply_normalization(data=batch[field],
+                                                              coefficients=coefficients[field],
+                                                              out=batch[field])
+
+        # Convert to tensor
+        for field in batch.keys():
+            batch[field] = self.network.numpy_to_tensor(data=batch[field],
+                                                        grad=grad)
+
+        return {field: batch[field] for field in net_fields}, {field: batch[field] for field in opt_fields}
+
     def compute_prediction_and_loss(self,
                                     optimize: bool,
                                     data_lines: List[List[int]],
-                                    normalization: Optional[Dict[str, List[float]]] = None) -> Dict[str, float]:
+                                    normalization: Optional[Dict[str, List[float]]] = None,
+                                    batch: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None) -> Dict[str, float]:
         """
         Make a prediction with the data passed as argument, optimize or not the network
 
         :param optimize: If true, run a backward propagation.
         :param data_lines: Batch of indices of samples in the Database.
         :param normalization: Normalization coefficients.
+        :param batch: Batch already prepared with 'prepare_batch', data_lines are then not read again.
         :return: The prediction and the associated loss value
         """
 
         # 1. Define Network and Optimization batches
-        batches = {}
-        normalization = {} if normalization is None else normalization
-        for side, fields in zip(['net', 'opt'], [self.network.net_fields, self.network.opt_fields]):
-            # Get the batch from the Database
-            batch = self.database_handler.get_lines(table_name='Training',
-                                                    fields=fields,
-                                                    lines_id=data_lines)
-            # Apply normalization and convert to tensor
-            for field in batch.keys():
-                batch[field] = array(batch[field])
-                if field in normalization:
-                    batch[field] = self.normalize_data(data=batch[field],
-                                                       normalization=normalization[field])
-                batch[field] = self.network.numpy_to_tensor(data=batch[field],
-                                                            grad=optimize)
-            batches[side] = batch
-        data_net, data_opt = batches.values()
-
-        # 2. Compute prediction
-        data_net = self.data_transformation.transform_before_prediction(data_net)
-        data_pred = self.network.predict(data_net)
+        if batch is None:
+            batch = self.prepare_batch(data_lines=data_lines,
+                                       normalization=normalization,
+                                       grad=optimize)
+        data_net, data_opt = batch
+
+        # 2. Compute prediction and loss (with mixed precision if enabled)
+        with self.network.autocast():
+            data_net = self.data_transformation.transform_before_prediction(data_net)
+            data_pred = self.network.predict(data_net)
 
-        # 3. Compute loss
-        data_pred, data_opt = self.data_transformation.transform_before_loss(data_pred, data_opt)
-        data_loss = self.optimization.compute_loss(data_pred, data_opt)
+            # 3. Compute loss
+            data_pred, data_opt = self.data_transformation.transform_before_loss(data_pred, data_opt)
+            data_loss = self.optimization.compute_loss(data_pred, data_opt)
 
         # 4. Optimize network if training
         if optimize:
@@ -220,7 +356,7 @@ class NetworkManager:
         """
 
         # Get Network data
-        normalization = {} if normalization is None else normalization
+        coefficients = self.get_normalization_coefficients(normalization)
         sample = self.database_handler.get_line(table_name='Exchange',
                                                 fields=self.network.net_fields,
                                                 line_id=instance_id)
@@ -228,10 +364,12 @@ class NetworkManager:
 
         # Apply normalization and convert to tensor
         for field in sample.keys():
-            sample[field] = array([sample[field]])
-            if field in normalization.keys():
-                sample[field] = self.normalize_data(data=sample[field],
-                                                    normalization=normalization[field])
+            # Add the batch dimension as a view instead of copying the sample in a new array
+            sample[field] = asarray(sample[field], dtype=self.network.config.data_type)[None]
+            if field in coefficients:
+                sample[field] = self.__apply_normalization(data=sample[field],
+                                                           coefficients=coefficients[field],
+                                                           out=sample[field])
             sample[field] = self.network.numpy_to_tensor(data=sample[field])
 
         # Compute prediction
@@ -243,35 +381,92 @@ class NetworkManager:
         # Return the prediction
         for field in data_pred.keys():
             data_pred[field] = self.network.tensor_to_numpy(data=data_pred[field][0])
-            if self.network.pred_norm_fields[field] in normalization.keys():
-                data_pred[field] = self.normalize_data(data=data_pred[field],
-                                                       normalization=normalization[self.network.pred_norm_fields[field]],
-                                                       reverse=True)
-            data_pred[field].reshape(-1)
+            norm_field = self.network.pred_norm_fields[field]
+            if norm_field in coefficients:
+                data_pred[field] = self.__apply_normalization(data=data_pred[field],
+                                                              coefficients=coefficients[norm_field],
+                                                              reverse=True,
+                                                              out=data_pred[field])
+            data_pred[field] = data_pred[field].reshape(-1)
         self.database_handler.update(table_name='Exchange',
                                      data=data_pred,
                                      line_id=instance_id)
 
-    @classmethod
-    def normalize_data(cls,
-                       data: ndarray,
-                       normalization: List[float],
-                       reverse: bool = False) -> ndarray:
+    def get_normalization_coefficients(self,
+                                       normalization: Optional[Dict[str, List[float]]] = None
+                                       ) -> Dict[str, Tuple[ndarray, ndarray, ndarray]]:
         """
-        Apply or unapply normalization following current standard score.
+        Get the normalization coefficients cast to the data type as (mean, std, 1 / std) for each field. They are only
+        computed again when new normalization coefficients are given.
 
-        :param data: Data to normalize.
         :param normalization: Normalization coefficients.
-        :param reverse: If True, apply normalization; if False, unapply normalization.
-        :return: Data with applied or misapplied normalization.
+        :return: Cached normalization coefficients.
+        """
+
+        if normalization is not self.__normalization:
+            data_type = self.network.config.data_type
+            coefficients = {}
+            for field, (mean, std) in ({} if normalization is None else normalization).items():
+                mean, std = asarray(mean, dtype=data_type), asarray(std, dtype=data_type)
+                coefficients[field] = (mean, std, asarray(1. / std, dtype=data_type))
+            self.__normalization_coefficients = coefficients
+            self.__normalization = normalization
+        return self.__normalization_coefficients
+
+    @staticmethod
+    def __apply_normalization(data: ndarray,
+                              coefficients: Tuple[Any, Any, Any],
+                              reverse: bool = False,
+                              out: Optional[ndarray] = None) -> ndarray:
+        """
+        Apply or unapply normalization with coefficients given as (mean, std, 1 / std).
+
+        :param data: Data to normalize.
+        :param coefficients: Normalization coefficients as (mean, std, 1 / std).
+        :param reverse: If True, unapply normalization; if False, apply normalization.
+        :param out: Array in which the result is stored (can be data itself); a new floating point array is allocated
+                    if None, read-only or unable to store floating point values.
+        :return: Data with applied or unapplied normalization.
         """
 
+        # Normalized data are always floating point values
+        mean, std, inv_std = coefficients
+        data_type = result_type(data, mean, std)
+        data_type = data_type if issubdtype(data_type, inexact) else float64
+        if out is None or not out.flags.writeable or not can_cast(data_type, out.dtype, casting='same_kind'):
+            out = empty(data.shape, dtype=data_type)
+
         # Unapply normalization
         if reverse:
-            return (data * normalization[1]) + normalization[0]
+            multiply(data, std, out=out)
+            return add(out, mean, out=out)
 
         # Apply normalization
-        return (data - normalization[0]) / normalization[1]
+        subtract(data, mean, out=out)
+        return multiply(out, inv_std, out=out)
+
+    @staticmethod
+    def normalize_data(data: ndarray,
+                       normalization: List[float],
+                       reverse: bool = False,
+                       out: Optional[ndarray] = None) -> ndarray:
+        """
+        Apply or unapply normalization following current standard score.
+
+        :param data: Data to normalize.
+        :param normalization: Normalization coefficients.
+        :param reverse: If True, unapply normalization; if False, apply normalization.
+        :param out: Array in which the result is stored (can be data itself); a new floating point array is allocated
+                    and returned instead if out is None, read-only or unable to store floating point values.
+        :return: Data with applied or unapplied normalization.
+        """
+
+        # Per component coefficients are converted to arrays, scalars are kept to preserve the data type
+        mean, std = [value if isinstance(value, (int, float)) else asarray(value) for value in normalization]
+        return NetworkManager.__apply_normalization(data=asarray(data),
+                                                    coefficients=(mean, std, 1. / std),
+                                                    reverse=reverse,
+                                                    out=out)
 
     ##########################################################################################
     ##########################################################################################
@@ -286,6 +481,9 @@ class NetworkManager:
 
         if self.is_training:
             self.save_network(last_save=True)
+        self.wait_saves()
+        if self.__save_pool is not None:
+            self.__save_pool.shutdown(wait=True)
         del self.network
 
     def __str__(self) -> str:
@@ -1,5 +1,7 @@
-from typing import Any, Dict
-from numpy import ndarray
+from typing import Any, Dict, ContextManager
+from contextlib import nullcontext
+from copy import deepcopy
+from numpy import ndarray, ascontiguousarray
 from collections import namedtuple
 
 
@@ -45,6 +47,16 @@ class BaseNetwork:
 
         raise NotImplementedError
 
+    def autocast(self) -> ContextManager:
+        """
+        Context in which the forward pass and the loss computation are done. Backends supporting mixed precision
+        should return their autocast context if 'mixed_precision' is set in the configuration.
+
+        :return: Context manager.
+        """
+
+        return nullcontext()
+
     def set_train(self) -> None:
         """
         Set the Network in training mode (compute gradient).
@@ -66,6 +78,22 @@ class BaseNetwork:
 
         raise NotImplementedError
 
+    def set_matmul_precision(self) -> None:
+        """
+        Set the precision of the float32 matrix products on the current device. Backends supporting TF32 should
+        apply the 'matmul_precision' of the configuration, which is 'highest' (no TF32) when 'use_tf32' is False.
+        """
+
+        pass
+
+    def compile_forward(self) -> None:
+        """
+        Compile the forward pass of the Network. Called once the parameters are set if 'use_compile' is set in the
+        configuration; backends without compilation can keep the eager forward pass.
+        """
+
+        pass
+
     def load_parameters(self,
                         path: str) -> None:
         """
@@ -95,6 +123,29 @@ class BaseNetwork:
 
         raise NotImplementedError
 
+    def copy_parameters(self) -> Any:
+        """
+        Return a copy of the current state of Network parameters, that will not be modified by the next optimization
+        steps.
+
+        :return: Copy of the Network parameters.
+        """
+
+        return deepcopy(self.get_parameters())
+
+    def write_parameters(self,
+                         parameters: Any,
+                         path: str) -> None:
+        """
+        Save a copy of the network parameters to the path location. This is called from a background thread, if this
+        method is not implemented then intermediate saves are done synchronously with 'save_parameters'.
+
+        :param parameters: Copy of the Network parameters returned by 'copy_parameters'.
+        :param path: Path where to save the parameters.
+        """
+
+        raise NotImplementedError
+
     def nb_parameters(self) -> int:
         """
         Return the number of parameters of the network.
@@ -115,7 +166,8 @@ class BaseNetwork:
         :return: Converted tensor.
         """
 
-        return data.astype(self.config.data_type)
+        # No copy if the data is already contiguous with the right type
+        return ascontiguousarray(data, dtype=self.config.data_type)
 
     def tensor_to_numpy(self,
                         data: Any) -> ndarray:
@@ -126,7 +178,8 @@ class BaseNetwork:
         :return: Converted array.
         """
 
-        return data.astype(self.config.data_type)
+        # No copy if the data already has the right type
+        return data.astype(self.config.data_type, copy=False)
 
     def __str__(self) -> str:
 
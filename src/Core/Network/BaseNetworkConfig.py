@@ -1,4 +1,4 @@
-from typing import Any, Optional, Type
+from typing import Any, Dict, Optional, Type
 from os.path import isdir
 from numpy import sctypeDict
 
@@ -23,7 +23,13 @@ class BaseNetworkConfig:
                  lr: Optional[float] = None,
                  require_training_stuff: bool = True,
                  loss: Optional[Any] = None,
-                 optimizer: Optional[Any] = None):
+                 optimizer: Optional[Any] = None,
+                 optimizer_kwargs: Optional[Dict[str, Any]] = None,
+                 mixed_precision: bool = False,
+                 use_tf32: bool = True,
+                 matmul_precision: Optional[str] = None,
+                 use_compile: bool = False,
+                 preload_max_size: Optional[float] = None):
         """
         BaseNetworkConfig is a configuration class to parameterize and create BaseNetwork, BaseOptimization and
         BaseTransformation for the NetworkManager.
@@ -42,6 +48,15 @@ class BaseNetworkConfig:
         :param require_training_stuff: If specified, loss and optimizer class can be not necessary for training.
         :param loss: Loss class.
         :param optimizer: Network's parameters optimizer class.
+        :param optimizer_kwargs: Additional arguments to pass to the optimizer (e.g. fused implementations).
+        :param mixed_precision: If True, the forward pass and the loss computation are done with mixed precision and
+                                the loss is scaled before the backward pass.
+        :param use_tf32: If True, float32 matrix products are allowed to use TF32 on devices supporting it.
+        :param matmul_precision: Internal precision of float32 matrix products, between 'highest', 'high' and 'medium'.
+                                 By default, 'high' if use_tf32 is True, 'highest' otherwise.
+        :param use_compile: If True, the forward pass of the network is compiled by the backend.
+        :param preload_max_size: Maximum size (in GB) of a Dataset that is loaded and normalized once in memory when
+                                 the training data are only read from the Database. Preloading is disabled if None.
         """
 
         self.name = self.__class__.__name__
@@ -73,6 +88,39 @@ class BaseNetworkConfig:
         if data_type not in sctypeDict:
             raise ValueError(
                 f"[{self.__class__.__name__}] The following data type is not a numpy type: {data_type}")
+        # Check optimizer_kwargs type
+        optimizer_kwargs = {} if optimizer_kwargs is None else optimizer_kwargs
+        if type(optimizer_kwargs) != dict:
+            raise TypeError(f"[{self.__class__.__name__}] Wrong 'optimizer_kwargs' type: dict required, get "
+                            f"{type(optimizer_kwargs)}")
+        # Check mixed_precision type
+        if type(mixed_precision) != bool:
+            raise TypeError(
+                f"[{self.__class__.__name__}] Wrong 'mixed_precision' type: bool required, get {type(mixed_precision)}")
+        # Check use_tf32 type
+        if type(use_tf32) != bool:
+            raise TypeError(
+                f"[{self.__class__.__name__}] Wrong 'use_tf32' type: bool required, get {type(use_tf32)}")
+        # Check matmul_precision value, lower precisions use TF32
+        matmul_precision = ('high' if use_tf32 else 'highest') if matmul_precision is None else matmul_precision
+        if matmul_precision not in ['highest', 'high', 'medium']:
+            raise ValueError(f"[{self.__class__.__name__}] The given 'matmul_precision'={matmul_precision} must be in "
+                             f"['highest', 'high', 'medium'].")
+        if not use_tf32 and matmul_precision != 'highest':
+            raise ValueError(f"[{self.__class__.__name__}] The given 'matmul_precision'={matmul_precision} enables "
+                             f"TF32, it must be 'highest' when 'use_tf32' is False.")
+        # Check use_compile type
+        if type(use_compile) != bool:
+            raise TypeError(
+                f"[{self.__class__.__name__}] Wrong 'use_compile' type: bool required, get {type(use_compile)}")
+
+        # Check preload_max_size type and value
+        if preload_max_size is not None:
+            if type(preload_max_size) not in [int, float]:
+                raise TypeError(f"[{self.__class__.__name__}] Wrong 'preload_max_size' type: float required, get "
+                                f"{type(preload_max_size)}")
+            if preload_max_size < 0:
+                raise ValueError(f"[{self.__class__.__name__}] Given 'preload_max_size' value is negative")
 
         # BaseNetwork parameterization
         self.network_class: Type[BaseNetwork] = network_class
@@ -80,7 +128,11 @@ class BaseNetworkConfig:
                                                       configuration_name='network_config',
                                                       network_name=network_name,
                                                       network_type=network_type,
-                                                      data_type=data_type)
+                                                      data_type=data_type,
+                                                      mixed_precision=mixed_precision,
+                                                      use_tf32=use_tf32,
+                                                      matmul_precision=matmul_precision,
+                                                      use_compile=use_compile)
 
         # BaseOptimization parameterization
         self.optimization_class: Type[BaseOptimization] = optimization_class
@@ -88,7 +140,9 @@ class BaseNetworkConfig:
                                                            configuration_name='optimization_config',
                                                            loss=loss,
                                                            lr=lr,
-                                                           optimizer=optimizer)
+                                                           optimizer=optimizer,
+                                                           optimizer_kwargs=optimizer_kwargs,
+                                                           mixed_precision=mixed_precision)
         self.training_stuff: bool = (loss is not None) and (optimizer is not None) or (not require_training_stuff)
 
         # NetworkManager parameterization
@@ -100,6 +154,7 @@ class BaseNetworkConfig:
         self.network_dir: str = network_dir
         self.which_network: int = which_network
         self.save_each_epoch: bool = save_each_epoch and self.training_stuff
+        self.preload_max_size: Optional[float] = preload_max_size
 
     def create_network(self) -> BaseNetwork:
         """
@@ -152,4 +207,9 @@ class BaseNetworkConfig:
         description += f"    Network directory: {self.network_dir}\n"
         description += f"    Which network: {self.which_network}\n"
         description += f"    Save each epoch: {self.save_each_epoch}\n"
+        description += f"    Preload max size: {self.preload_max_size}\n"
+        description += f"    Mixed precision: {self.network_config.mixed_precision}\n"
+        description += f"    Use TF32: {self.network_config.use_tf32}\n"
+        description += f"    Matmul precision: {self.network_config.matmul_precision}\n"
+        description += f"    Use compile: {self.network_config.use_compile}\n"
         return description
@@ -24,6 +24,10 @@ class BaseOptimization:
         self.optimizer_class = config.optimizer
         self.optimizer = None
         self.lr = config.lr
+        self.optimizer_kwargs: Dict[str, Any] = config.optimizer_kwargs
+
+        # Mixed precision (loss scaling is handled by the backend in 'optimize')
+        self.mixed_precision: bool = config.mixed_precision
 
     def set_loss(self) -> None:
         """
@@ -59,7 +63,8 @@ class BaseOptimization:
     def set_optimizer(self,
                       net: BaseNetwork) -> None:
         """
-        Define an optimization process.
+        Define an optimization process. The 'optimizer_kwargs' must be given to the optimizer, backends can also
+        add their own defaults (e.g. fused kernels on GPU) when the user did not specify them.
 
         :param net: Network whose parameters will be optimized.
         """
@@ -81,4 +86,6 @@ class BaseOptimization:
         description += f"    Optimizer class: {self.optimizer_class.__name__}\n" if self.optimizer_class else \
             f"    Optimizer class: None\n"
         description += f"    Learning rate: {self.lr}\n"
+        description += f"    Optimizer arguments: {self.optimizer_kwargs}\n"
+        description += f"    Mixed precision: {self.mixed_precision}\n"
         return description
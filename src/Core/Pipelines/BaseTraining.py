@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from os.path import join, isfile, exists, sep
 from datetime import datetime
 from vedo import ProgressBar
@@ -9,8 +9,10 @@ from DeepPhysX.Core.Manager.NetworkManager import NetworkManager
 from DeepPhysX.Core.Manager.StatsManager import StatsManager
 from DeepPhysX.Core.Network.BaseNetworkConfig import BaseNetworkConfig
 from DeepPhysX.Core.Database.BaseDatabaseConfig import BaseDatabaseConfig
+from DeepPhysX.Core.Database.DatabaseHandler import DatabaseHandler
 from DeepPhysX.Core.Environment.BaseEnvironmentConfig import BaseEnvironmentConfig
 from DeepPhysX.Core.Utils.path import create_dir
+from DeepPhysX.Core.Utils.prefetcher import DataPrefetcher
 
 
 class BaseTraining(BasePipeline):
@@ -25,7 +27,8 @@ class BaseTraining(BasePipeline):
                  epoch_nb: int = 0,
                  batch_nb: int = 0,
                  batch_size: int = 0,
-                 debug: bool = False):
+                 debug: bool = False,
+                 use_data_prefetch: bool = False):
         """
         BaseTraining implements the main loop that defines the training process of an artificial neural network.
         Training can be launched with several data sources (from a Dataset, from an Environment, from combined sources).
@@ -41,6 +44,8 @@ class BaseTraining(BasePipeline):
         :param batch_nb: Number of batches to use.
         :param batch_size: Number of samples in a single batch.
         :param debug: If True, main training features will not be launched.
+        :param use_data_prefetch: If True, the next batches are prepared in a background thread when the training
+                                  data are only read from the Database.
         """
 
         BasePipeline.__init__(self,
@@ -94,6 +99,10 @@ class BaseTraining(BasePipeline):
         self.nb_samples = batch_nb * batch_size * epoch_nb
         self.loss_dict = None
         self.debug = debug
+        self.use_data_prefetch = use_data_prefetch
+        self.data_prefetcher: Optional[DataPrefetcher] = None
+        self.prefetch_handler: Optional[DatabaseHandler] = None
+        self.prefetch_normalization: Optional[Dict[str, List[float]]] = None
 
         # Progressbar
         self.digits = ['{' + f':0{len(str(self.epoch_nb))}d' + '}',
@@ -129,7 +138,57 @@ class BaseTraining(BasePipeline):
         Called once at the beginning of the training Pipeline.
         """
 
-        pass
+        # Small Datasets can be kept in memory when they are only read from the Database
+        if self.data_manager.environment_manager is None:
+            self.network_manager.preload_data(normalization=self.data_manager.normalization)
+
+        # Batches can only be prepared in advance when they are not produced by Environments
+        if self.use_data_prefetch and self.data_manager.environment_manager is None:
+            # The Database is not edited, so the normalization coefficients are set once here in the main thread
+            self.prefetch_normalization = self.data_manager.normalization
+            self.network_manager.get_normalization_coefficients(self.prefetch_normalization)
+            self.data_prefetcher = DataPrefetcher(get_lines=self.prefetch_lines,
+                                                  prepare=self.prefetch_batch,
+                                                  nb_batches=self.epoch_nb * self.batch_nb,
+                                                  on_start=self.prefetch_start,
+                                                  on_exit=self.prefetch_exit)
+
+    def prefetch_start(self) -> None:
+        """
+        Open the connections of the background thread to the Database partitions.
+        """
+
+        self.prefetch_handler = self.network_manager.get_database_handler().open_copy()
+
+    def prefetch_exit(self) -> None:
+        """
+        Close the connections of the background thread to the Database partitions.
+        """
+
+        if self.prefetch_handler is not None:
+            self.prefetch_handler.close()
+            self.prefetch_handler = None
+
+    def prefetch_lines(self) -> List[List[int]]:
+        """
+        Select the indices of the next batch to prepare in the background thread.
+        """
+
+        # Only the DatabaseManager indexing is used, the DataManager keeps the indices of the current batch
+        return self.data_manager.database_manager.get_data(batch_size=self.batch_size)
+
+    def prefetch_batch(self,
+                       data_lines: List[List[int]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Prepare the next batch in the background thread.
+
+        :param data_lines: Batch of indices of samples in the Database.
+        """
+
+        return self.network_manager.prepare_batch(data_lines=data_lines,
+                                                  normalization=self.prefetch_normalization,
+                                                  grad=True,
+                                                  database_handler=self.prefetch_handler)
 
     def epoch_condition(self) -> bool:
         """
@@ -167,6 +226,14 @@ class BaseTraining(BasePipeline):
         Pulls data, run a prediction and an optimizer step.
         """
 
+        # Use the batch prepared in the background thread
+        if self.data_prefetcher is not None:
+            self.data_manager.data_lines, batch = next(self.data_prefetcher)
+            self.loss_dict = self.network_manager.compute_prediction_and_loss(data_lines=self.data_manager.data_lines,
+                                                                              batch=batch,
+                                                                              optimize=True)
+            return
+
         self.data_manager.get_data(epoch=self.epoch_id,
                                    animate=True)
         self.loss_dict = self.network_manager.compute_prediction_and_loss(
@@ -216,6 +283,8 @@ class BaseTraining(BasePipeline):
         Called once at the end of the training Pipeline.
         """
 
+        if self.data_prefetcher is not None:
+            self.data_prefetcher.close()
         self.data_manager.close()
         self.network_manager.close()
         if self.stats_manager is not None:
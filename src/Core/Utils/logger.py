@@ -0,0 +1,77 @@
+from typing import Optional, TextIO
+from logging import Logger, LogRecord, getLogger, Handler, StreamHandler, Formatter, INFO
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from sys import stdout
+from atexit import register
+
+
+class _DefaultHandler(StreamHandler):
+
+    def __init__(self):
+        """
+        Default handler of the 'DeepPhysX' logger, records are displayed on stdout like the messages of the other
+        components as long as the application did not configure the root logger.
+        """
+
+        StreamHandler.__init__(self, stdout)
+        self.setFormatter(Formatter('%(message)s'))
+
+    def emit(self,
+             record: LogRecord) -> None:
+        """
+        Display a record if it is not already handled by the handlers of the application.
+
+        :param record: Record to display.
+        """
+
+        if not getLogger().handlers:
+            StreamHandler.emit(self, record)
+
+
+_default_handler: Handler = _DefaultHandler()
+getLogger('DeepPhysX').addHandler(_default_handler)
+getLogger('DeepPhysX').setLevel(INFO)
+
+
+def get_logger(name: str) -> Logger:
+    """
+    Get the logger of a component. Records are propagated to the 'DeepPhysX' logger, so they can be routed or
+    silenced with the standard logging configuration of the application.
+
+    :param name: Name of the component.
+    :return: Logger of the component.
+    """
+
+    return getLogger(f'DeepPhysX.{name}')
+
+
+def configure_logging(level: int = INFO,
+                      stream: Optional[TextIO] = None,
+                      background: bool = False) -> Handler:
+    """
+    Replace the default handler of the 'DeepPhysX' logger. Should only be called by the application entry point, once.
+
+    :param level: Minimum level of the displayed records.
+    :param stream: Stream in which records are written, stdout by default.
+    :param background: If True, records are formatted and written by a background thread, so that the calling
+                       thread never waits for the stream. Records may then be displayed after later prints.
+    :return: Handler added to the 'DeepPhysX' logger.
+    """
+
+    handler = StreamHandler(stdout if stream is None else stream)
+    handler.setFormatter(Formatter('%(message)s'))
+
+    # Records are pushed in a queue, pending records are written at exit
+    if background:
+        queue: SimpleQueue = SimpleQueue()
+        listener = QueueListener(queue, handler)
+        listener.start()
+        register(listener.stop)
+        handler = QueueHandler(queue)
+
+    logger = getLogger('DeepPhysX')
+    logger.removeHandler(_default_handler)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return handler
@@ -0,0 +1,113 @@
+from typing import Any, Callable, List, Optional, Tuple
+from threading import Thread, Event
+from queue import Queue, Empty, Full
+
+
+class DataPrefetcher:
+
+    def __init__(self,
+                 get_lines: Callable[[], List[List[int]]],
+                 prepare: Callable[[List[List[int]]], Any],
+                 nb_batches: int,
+                 queue_size: int = 2,
+                 on_start: Optional[Callable[[], None]] = None,
+                 on_exit: Optional[Callable[[], None]] = None):
+        """
+        DataPrefetcher prepares the next batches in a background thread while the current batch is used by the
+        Network, so that data reading and conversion overlap forward and backward passes.
+
+        :param get_lines: Function returning the indices of the next batch of samples in the Database.
+        :param prepare: Function turning a batch of indices into Network ready data.
+        :param nb_batches: Total number of batches to prepare.
+        :param queue_size: Maximum number of batches prepared in advance.
+        :param on_start: Function called in the background thread before the first batch (e.g. to open the connections
+                         of the thread to the Database).
+        :param on_exit: Function called in the background thread when it stops.
+        """
+
+        self.name: str = self.__class__.__name__
+
+        # Producer variables
+        self.__get_lines = get_lines
+        self.__prepare = prepare
+        self.__nb_batches: int = nb_batches
+        self.__on_start: Callable[[], None] = (lambda: None) if on_start is None else on_start
+        self.__on_exit: Callable[[], None] = (lambda: None) if on_exit is None else on_exit
+        self.__queue: Queue = Queue(maxsize=queue_size)
+        self.__stop: Event = Event()
+        self.__end = object()
+
+        # Launch the producer
+        self.__thread: Thread = Thread(target=self.__producer, daemon=True)
+        self.__thread.start()
+
+    def __producer(self) -> None:
+        """
+        Prepare batches and push them in the queue until the number of batches is reached.
+        """
+
+        try:
+            self.__on_start()
+            for _ in range(self.__nb_batches):
+                data_lines = self.__get_lines()
+                if not self.__put((data_lines, self.__prepare(data_lines))):
+                    return
+            self.__put(self.__end)
+        except Exception as exception:
+            self.__put(exception)
+        finally:
+            self.__on_exit()
+
+    def __put(self,
+              item: Any) -> bool:
+        """
+        Push an item in the queue without blocking the closing procedure.
+
+        :param item: Item to push.
+        :return: False if the DataPrefetcher was closed before the item could be pushed.
+        """
+
+        while not self.__stop.is_set():
+            try:
+                self.__queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def __iter__(self) -> 'DataPrefetcher':
+
+        return self
+
+    def __next__(self) -> Tuple[List[List[int]], Any]:
+        """
+        Get the next prepared batch.
+
+        :return: Indices of the samples and the prepared batch.
+        """
+
+        item = self.__queue.get()
+        if item is self.__end:
+            self.__queue.put(item)
+            raise StopIteration
+        # Re-raise the exceptions of the producer in the main thread
+        if isinstance(item, Exception):
+            self.__queue.put(item)
+            raise item
+        return item
+
+    def close(self,
+              timeout: Optional[float] = None) -> None:
+        """
+        Stop the producer and release the prepared batches.
+
+        :param timeout: Maximum time to wait for the producer to finish.
+        """
+
+        self.__stop.set()
+        while True:
+            try:
+                self.__queue.get_nowait()
+            except Empty:
+                break
+        self.__thread.join(timeout=timeout)
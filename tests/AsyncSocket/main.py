@@ -4,6 +4,7 @@ from sys import stdout
 
 from tests_BytesConverter import TestBytesConverter
 from tests_TcpIpObject import TestTcpIpObjects
+from tests_TcpIpServer import TestTcpIpServer
 
 
 if __name__ == '__main__':
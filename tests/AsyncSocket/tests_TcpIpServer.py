@@ -0,0 +1,83 @@
+from unittest import TestCase
+from types import SimpleNamespace
+
+from DeepPhysX.Core.AsyncSocket.TcpIpServer import TcpIpServer
+
+
+class TestTcpIpServer(TestCase):
+
+    def setUp(self):
+        self.server = None
+        self.nb_produced = 0
+        self.partition_id = 0
+
+    def tearDown(self):
+        if self.server is not None:
+            self.server.sock.close()
+
+    def create_server(self, nb_client, batch_size, prefetch_factor):
+        # The EnvironmentManager is only used to connect the DatabaseHandler
+        manager = SimpleNamespace(data_manager=SimpleNamespace(connect_handler=lambda handler: None))
+        self.server = TcpIpServer(ip_address='localhost', port=11112, nb_client=nb_client, batch_size=batch_size,
+                                  prefetch_factor=prefetch_factor, manager=manager)
+        self.server.clients = [[i + 1, None] for i in range(nb_client)]
+
+        # Each Client produces a new sample when it communicates
+        async def communicate(client=None, client_id=None, animate=True):
+            self.nb_produced += 1
+            self.server.data_lines.append([self.partition_id, self.nb_produced])
+        self.server._TcpIpServer__communicate = communicate
+
+    def test_no_prefetch(self):
+        self.create_server(nb_client=3, batch_size=4, prefetch_factor=0)
+        for i in range(5):
+            self.assertEqual(self.server.get_batch(), [[0, line] for line in range(4 * i + 1, 4 * i + 5)])
+        # No sample is produced in advance
+        self.assertEqual(self.nb_produced, 20)
+        self.assertEqual(self.server.prefetched_lines, [])
+
+    def test_prefetch(self):
+        self.create_server(nb_client=3, batch_size=4, prefetch_factor=1)
+        consumed = []
+        for _ in range(10):
+            batch = self.server.get_batch()
+            self.assertEqual(len(batch), 4)
+            consumed += batch
+            # The samples produced in advance are bounded and counted across batches
+            self.assertLessEqual(len(self.server.prefetched_lines), self.server.max_prefetched_lines)
+            self.assertEqual(self.nb_produced, len(consumed) + len(self.server.prefetched_lines))
+        # Samples are used in the production order, each of them once
+        self.assertEqual(consumed + self.server.prefetched_lines,
+                         [[0, line] for line in range(1, self.nb_produced + 1)])
+        # Idle Clients were used, so fewer rounds of communication are needed
+        self.assertGreater(self.nb_produced, len(consumed))
+
+    def test_prefetch_dataset_batch(self):
+        self.create_server(nb_client=3, batch_size=4, prefetch_factor=1)
+        # Samples are not produced in advance from a batch of the Dataset
+        self.server.set_dataset_batch([[0, line] for line in range(1, 5)])
+        self.assertEqual(len(self.server.get_batch()), 4)
+        self.assertEqual(self.server.prefetched_lines, [])
+        self.assertEqual(self.nb_produced, 4)
+
+    def test_prefetch_stop_production(self):
+        self.create_server(nb_client=3, batch_size=4, prefetch_factor=1)
+        produced = []
+        for _ in range(10):
+            self.server.get_batch()
+            produced += self.server.produced_lines
+            # Whenever the production stops, every stored sample was given with a batch, even the ones kept in advance
+            self.assertEqual(produced, [[0, line] for line in range(1, self.nb_produced + 1)])
+        self.assertNotEqual(self.server.prefetched_lines, [])
+
+    def test_prefetch_partition_switch(self):
+        self.create_server(nb_client=3, batch_size=4, prefetch_factor=1)
+        for partition_id in range(10):
+            # A new partition is created between two batches
+            self.partition_id = partition_id
+            batch = self.server.get_batch()
+            # The samples given with a batch were all stored in the current partition, even if the batch itself uses
+            # samples of the previous partition
+            for line in self.server.produced_lines:
+                self.assertEqual(line[0], partition_id)
+            self.assertTrue(all(line[0] in (partition_id - 1, partition_id) for line in batch))
@@ -0,0 +1 @@
+from .tests_DatabaseHandler import TestDatabaseHandler
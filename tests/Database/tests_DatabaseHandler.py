@@ -0,0 +1,56 @@
+from unittest import TestCase
+from numpy import array, arange
+
+from DeepPhysX.Core.Database.DatabaseHandler import DatabaseHandler
+
+
+class Partition:
+
+    def __init__(self, nb_lines, offset):
+        # Each line stores its own index in the 'input' field and the global sample index in the 'label' field
+        self.data = {line: {'input': array([line, line], dtype=float), 'label': offset + line}
+                     for line in range(1, nb_lines + 1)}
+
+    def get_lines(self, table_name, lines_id, fields, batched):
+        # Lines are returned once in the reversed order to check that the requested order is restored
+        lines = sorted(set(line for line in lines_id if line in self.data), reverse=True)
+        batch = {'id': lines}
+        for field in fields:
+            batch[field] = [self.data[line][field] for line in lines]
+        return batch
+
+
+class TestDatabaseHandler(TestCase):
+
+    def setUp(self):
+        self.handler = DatabaseHandler()
+        self.handler.init(storing_partitions=[Partition(nb_lines=5, offset=0), Partition(nb_lines=3, offset=5)],
+                          exchange_db=None)
+
+    def test_get_lines_as_arrays_order(self):
+        # Shuffled, repeated and multi-partition indices
+        lines_id = [[1, 2], [0, 4], [0, 1], [1, 2], [0, 4], [1, 3], [0, 5], [1, 1]]
+        batch = self.handler.get_lines_as_arrays(table_name='Training',
+                                                 lines_id=lines_id,
+                                                 fields=['input', 'label'],
+                                                 dtype='float32')
+        self.assertEqual(batch['input'].shape, (8, 2))
+        self.assertEqual(batch['input'].dtype, 'float32')
+        self.assertEqual(batch['input'][:, 0].tolist(), [line for _, line in lines_id])
+        self.assertEqual(batch['label'].tolist(), [5 * partition + line for partition, line in lines_id])
+
+    def test_get_lines_as_arrays_single_field(self):
+        batch = self.handler.get_lines_as_arrays(table_name='Training',
+                                                 lines_id=[[0, line] for line in arange(5, 0, -1)],
+                                                 fields='label')
+        self.assertEqual(list(batch.keys()), ['label'])
+        self.assertEqual(batch['label'].tolist(), [5, 4, 3, 2, 1])
+
+    def test_get_lines_as_arrays_missing_lines(self):
+        # A missing line between existing ones must not take the data of a neighbour
+        self.handler.get_partitions()[0].data.pop(3)
+        self.assertRaises(IndexError, self.handler.get_lines_as_arrays, 'Training', [[0, 2], [0, 3]], 'label')
+        # A missing line after the last one
+        self.assertRaises(IndexError, self.handler.get_lines_as_arrays, 'Training', [[1, 2], [1, 4]], 'label')
+        # A partition without any requested line
+        self.assertRaises(IndexError, self.handler.get_lines_as_arrays, 'Training', [[1, 7]], 'label')
@@ -5,7 +5,8 @@ import numpy as np
 from DeepPhysX.Core.Network.BaseNetworkConfig import BaseNetworkConfig
 from DeepPhysX.Core.Network.BaseNetwork import BaseNetwork
 from DeepPhysX.Core.Network.BaseOptimization import BaseOptimization
-from DeepPhysX.Core.Network.DataTransformation import DataTransformation
+from DeepPhysX.Core.Network.BaseTransformation import BaseTransformation
+from DeepPhysX.Core.Utils.configs import make_config
 
 
 class NumpyNetwork(BaseNetwork):
@@ -40,6 +41,9 @@ class NumpyNetwork(BaseNetwork):
     def save_parameters(self, path):
         np.save(path, self.get_parameters())
 
+    def write_parameters(self, parameters, path):
+        np.save(path, parameters)
+
     def nb_parameters(self):
         return len(self.p)
 
@@ -78,21 +82,21 @@ class NumpyOptimisation(BaseOptimization):
             self.net.p[i] -= self.lr * grad_p_i
 
 
-class NumpyDataTransformation(DataTransformation):
+class NumpyDataTransformation(BaseTransformation):
 
     def __init__(self, config):
         super(NumpyDataTransformation, self).__init__(config)
         self.data_type = np.ndarray
 
-    @DataTransformation.check_type
+    @BaseTransformation.check_type
     def transform_before_prediction(self, data_in):
         return data_in
 
-    @DataTransformation.check_type
+    @BaseTransformation.check_type
     def transform_before_loss(self, data_out, data_gt=None):
         return data_out, data_gt
 
-    @DataTransformation.check_type
+    @BaseTransformation.check_type
     def transform_before_apply(self, data_out):
         return data_out
 
@@ -121,4 +125,6 @@ class NumpyNetworkConfig(BaseNetworkConfig):
                                                  save_each_epoch=save_each_epoch,
                                                  lr=lr,
                                                  require_training_stuff=require_training_stuff)
-        self.network_config = self.make_config('network_config', nb_parameters=nb_parameters)
+        self.network_config = make_config(configuration_object=self,
+                                          configuration_name='network_config',
+                                          nb_parameters=nb_parameters)
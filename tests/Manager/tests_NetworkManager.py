@@ -1,6 +1,7 @@
 from unittest import TestCase
 import shutil
-from numpy import array, arange, load
+from tempfile import mkdtemp
+from numpy import array, arange, load, save
 from numpy.random import shuffle
 import os
 import sys
@@ -12,6 +13,26 @@ from DeepPhysX.Core.Manager.NetworkManager import NetworkManager
 from TestNetwork import NumpyNetwork, NumpyOptimisation, NumpyDataTransformation, NumpyNetworkConfig
 
 
+class Partition:
+
+    def __init__(self, nb_lines, offset):
+        self.data = {line: {'input': array([line, offset], dtype=float), 'ground_truth': array([offset + line])}
+                     for line in range(1, nb_lines + 1)}
+
+    def nb_lines(self, table_name):
+        return len(self.data)
+
+    def get_line(self, table_name, line_id, fields):
+        return {field: self.data[line_id][field] for field in fields}
+
+    def get_lines(self, table_name, lines_id, fields, batched):
+        lines = sorted(set(lines_id))
+        batch = {'id': lines}
+        for field in fields:
+            batch[field] = [self.data[line][field] for line in lines]
+        return batch
+
+
 class TestNetworkManager(TestCase):
 
     def setUp(self):
@@ -121,3 +142,102 @@ class TestNetworkManager(TestCase):
         self.assertEqual(os.listdir(self.manager.network_dir), ['network.npy'])
         self.assertRaises(AttributeError, self.manager.close)
         self.manager = None
+
+    def create_manager(self):
+        session = mkdtemp()
+        self.addCleanup(shutil.rmtree, session, ignore_errors=True)
+        self.manager = NetworkManager(network_config=self.net_config,
+                                      pipeline='training',
+                                      session=session)
+        return self.manager
+
+    def test_load_network_files(self):
+        self.create_manager()
+        # Only the final save and the intermediate saves are valid network files
+        files = {'training_network_2.npy': 2., 'training_network_10.npy': 10., 'network.npy': -1.,
+                 'network_backup.npy': 0., 'my_network_final.npy': 0., 'training_network_1.npy.bak': 0.}
+        for name, value in files.items():
+            with open(os.path.join(self.manager.network_dir, name), 'wb') as file:
+                save(file, array([value]))
+        os.mkdir(os.path.join(self.manager.network_dir, 'training_network_3.npy'))
+        # Intermediate saves are sorted by index, the final save is the last one
+        for which_network, value in [(0, 2.), (1, 10.), (2, -1.), (-1, -1.), (10, -1.)]:
+            self.manager.load_network(which_network=which_network)
+            self.assertEqual(self.manager.network.get_parameters().tolist(), [value])
+
+    def test_normalize_data(self):
+        data = array([[1., 2.], [3., 6.]])
+        # New array
+        normalized = NetworkManager.normalize_data(data=data, normalization=[2., 4.])
+        self.assertEqual(normalized.tolist(), [[-0.25, 0.], [0.25, 1.]])
+        self.assertEqual(data.tolist(), [[1., 2.], [3., 6.]])
+        # In place
+        values = data.copy()
+        self.assertIs(NetworkManager.normalize_data(data=values, normalization=[2., 4.], out=values), values)
+        self.assertEqual(values.tolist(), normalized.tolist())
+        # Reverse in place
+        self.assertIs(NetworkManager.normalize_data(data=values, normalization=[2., 4.], reverse=True, out=values),
+                      values)
+        self.assertEqual(values.tolist(), data.tolist())
+        # Integer data and coefficients give floating point values, the data type is kept for floating point data
+        self.assertEqual(NetworkManager.normalize_data(data=array([1, 3]), normalization=[1, 2]).tolist(), [0., 1.])
+        self.assertEqual(NetworkManager.normalize_data(data=array([1, 3]), normalization=[1, 2]).dtype.kind, 'f')
+        self.assertEqual(NetworkManager.normalize_data(data=array([1, 3], dtype='float32'),
+                                                       normalization=[1., 2.]).dtype, 'float32')
+        # Per component coefficients
+        self.assertEqual(NetworkManager.normalize_data(data=array([[3., 6.]]),
+                                                       normalization=[[1., 2.], [2., 4.]]).tolist(), [[1., 1.]])
+        # An output array unable to store the result is not used
+        values = array([1, 3])
+        normalized = NetworkManager.normalize_data(data=values, normalization=[1, 2], out=values)
+        self.assertIsNot(normalized, values)
+        self.assertEqual(values.tolist(), [1, 3])
+
+    def test_preload_data(self):
+        self.net_config.preload_max_size = 1.
+        self.create_manager()
+        partitions = [Partition(nb_lines=4, offset=0), Partition(nb_lines=0, offset=4), Partition(nb_lines=3, offset=4)]
+        self.manager.database_handler.init(storing_partitions=partitions, exchange_db=None)
+        normalization = {'input': [1., 2.], 'ground_truth': [4., 8.]}
+        lines = [[2, 3], [0, 1], [2, 1], [0, 4], [0, 1]]
+        # Batch read from the Database
+        expected_net, expected_opt = self.manager.prepare_batch(data_lines=lines, normalization=normalization)
+        # Batch selected in the preloaded samples, the partitions are emptied to make sure they are no longer read
+        self.assertTrue(self.manager.preload_data(normalization=normalization))
+        for partition in partitions:
+            partition.data.clear()
+        data_net, data_opt = self.manager.prepare_batch(data_lines=lines, normalization=normalization)
+        self.assertEqual(data_net['input'].tolist(), expected_net['input'].tolist())
+        self.assertEqual(data_opt['ground_truth'].tolist(), expected_opt['ground_truth'].tolist())
+        self.assertEqual(data_opt['ground_truth'].tolist(), [[0.375], [-0.375], [0.125], [0.], [-0.375]])
+
+    def test_save_network_background(self):
+        self.create_manager()
+        params = self.manager.network.get_parameters()
+        # Intermediate saves are written by the background thread
+        for _ in range(3):
+            self.manager.save_network()
+        self.manager.wait_saves()
+        template = os.path.join(self.manager.network_dir, self.manager.network_template_name)
+        for i in range(3):
+            self.assertTrue((load(template.format(i) + '.npy') == params).all())
+        # The final save is written once the intermediate saves are done
+        self.manager.close()
+        self.assertTrue((load(os.path.join(self.manager.network_dir, 'network.npy')) == params).all())
+        self.manager = None
+
+    def test_save_network_background_error(self):
+        def write_parameters(parameters, path):
+            raise IOError('Disk full')
+
+        # The error of the background thread is raised with the next save
+        self.create_manager()
+        self.manager.network.write_parameters = write_parameters
+        self.manager.save_network()
+        self.assertRaises(IOError, self.manager.save_network)
+        # The error of the background thread is raised when closing
+        self.manager.wait_saves()
+        self.manager.save_network()
+        self.assertRaises(IOError, self.manager.close)
+        self.manager.close()
+        self.manager = None
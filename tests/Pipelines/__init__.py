@@ -0,0 +1 @@
+from .tests_Training import TestTraining
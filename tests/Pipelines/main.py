@@ -0,0 +1,10 @@
+import unittest
+from os import devnull
+from sys import stdout
+
+from tests_Training import TestTraining
+
+
+if __name__ == '__main__':
+    stdout = open(devnull, 'w')
+    unittest.main()
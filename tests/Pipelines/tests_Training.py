@@ -0,0 +1,99 @@
+from unittest import TestCase
+from types import SimpleNamespace
+from threading import current_thread, main_thread
+from tempfile import mkdtemp
+import shutil
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Manager'))
+
+from DeepPhysX.Core.Pipelines.BaseTraining import BaseTraining
+from DeepPhysX.Core.Manager.NetworkManager import NetworkManager
+from DeepPhysX.Core.Database.DatabaseHandler import DatabaseHandler
+
+from TestNetwork import NumpyNetworkConfig
+from tests_NetworkManager import Partition
+
+
+class DatabaseManager:
+
+    def __init__(self):
+        self.sample_id = 0
+        self.threads = []
+
+    def get_data(self, batch_size):
+        # Samples are alternatively taken in both partitions
+        self.threads.append(current_thread())
+        lines = [[i % 2, (i // 2) % 3 + 1] for i in range(self.sample_id, self.sample_id + batch_size)]
+        self.sample_id += batch_size
+        return lines
+
+
+class TestTraining(TestCase):
+
+    def setUp(self):
+        session = mkdtemp()
+        self.addCleanup(shutil.rmtree, session, ignore_errors=True)
+        self.network_manager = NetworkManager(network_config=NumpyNetworkConfig(lr=0.1),
+                                              pipeline='training',
+                                              session=session)
+        # The DatabaseHandler of the main thread must not be read by the background thread
+        self.network_manager.database_handler.init(storing_partitions=[], exchange_db=None)
+        self.prefetch_handler = DatabaseHandler()
+        self.prefetch_handler.init(storing_partitions=[Partition(nb_lines=3, offset=0),
+                                                       Partition(nb_lines=3, offset=3)],
+                                   exchange_db=None)
+        self.opened, self.closed, self.batches = [], [], []
+        self.network_manager.database_handler.open_copy = self.open_copy
+        self.prefetch_handler.close = lambda: self.closed.append(current_thread())
+        self.network_manager.compute_prediction_and_loss = self.compute_prediction_and_loss
+
+    def open_copy(self):
+        self.opened.append(current_thread())
+        return self.prefetch_handler
+
+    def compute_prediction_and_loss(self, optimize, data_lines, normalization=None, batch=None):
+        self.batches.append((data_lines, batch))
+        return {'loss': 0.}
+
+    def create_training(self, epoch_nb, batch_nb, batch_size):
+        # Only the components used by the prefetch are defined
+        training = BaseTraining.__new__(BaseTraining)
+        training.data_manager = SimpleNamespace(environment_manager=None, normalization=None, data_lines=[],
+                                                database_manager=DatabaseManager(), close=lambda: None)
+        training.network_manager = self.network_manager
+        training.stats_manager = None
+        training.epoch_nb, training.epoch_id = epoch_nb, 0
+        training.batch_nb, training.batch_size = batch_nb, batch_size
+        training.use_data_prefetch = True
+        training.data_prefetcher, training.prefetch_handler, training.prefetch_normalization = None, None, None
+        return training
+
+    def test_prefetch(self):
+        training = self.create_training(epoch_nb=2, batch_nb=2, batch_size=3)
+        training.train_begin()
+        for _ in range(4):
+            training.optimize()
+        training.train_end()
+        # The Database is opened, read and closed by the background thread only
+        self.assertEqual(len(self.opened), 1)
+        self.assertEqual(len(self.closed), 1)
+        for thread in self.opened + self.closed + training.data_manager.database_manager.threads:
+            self.assertIsNot(thread, main_thread())
+        # Each batch contains the expected samples, the DataManager keeps the indices of the current batch
+        self.assertEqual(training.data_manager.database_manager.sample_id, 12)
+        for i, (data_lines, (data_net, data_opt)) in enumerate(self.batches):
+            self.assertEqual(data_lines, [[j % 2, (j // 2) % 3 + 1] for j in range(3 * i, 3 * i + 3)])
+            self.assertEqual(data_net['input'].tolist(), [[line, 3 * partition] for partition, line in data_lines])
+            self.assertEqual(data_opt['ground_truth'].tolist(), [[3 * partition + line]
+                                                                 for partition, line in data_lines])
+        self.assertEqual(training.data_manager.data_lines, self.batches[-1][0])
+
+    def test_prefetch_early_end(self):
+        training = self.create_training(epoch_nb=10, batch_nb=10, batch_size=3)
+        training.train_begin()
+        training.optimize()
+        # The background thread stops and closes the Database before the end of the batches
+        training.train_end()
+        self.assertEqual(len(self.closed), 1)
+        self.assertLess(training.data_manager.database_manager.sample_id, 300)
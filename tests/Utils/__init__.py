@@ -0,0 +1,2 @@
+from .tests_DataPrefetcher import TestDataPrefetcher
+from .tests_logger import TestLogger
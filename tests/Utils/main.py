@@ -0,0 +1,11 @@
+import unittest
+from os import devnull
+from sys import stdout
+
+from tests_DataPrefetcher import TestDataPrefetcher
+from tests_logger import TestLogger
+
+
+if __name__ == '__main__':
+    stdout = open(devnull, 'w')
+    unittest.main()
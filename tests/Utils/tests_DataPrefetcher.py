@@ -0,0 +1,79 @@
+from unittest import TestCase
+from threading import current_thread, main_thread
+from time import sleep
+
+from DeepPhysX.Core.Utils.prefetcher import DataPrefetcher
+
+
+class TestDataPrefetcher(TestCase):
+
+    def setUp(self):
+        self.counter = 0
+        self.threads = []
+        self.prefetcher = None
+
+    def tearDown(self):
+        if self.prefetcher is not None:
+            self.prefetcher.close(timeout=1.)
+
+    def get_lines(self):
+        self.counter += 1
+        return [[0, self.counter]]
+
+    def prepare(self, data_lines):
+        return {'input': data_lines[0][1] * 10}
+
+    def test_iteration(self):
+        self.prefetcher = DataPrefetcher(get_lines=self.get_lines,
+                                         prepare=self.prepare,
+                                         nb_batches=3)
+        # Batches are given in the production order
+        batches = [batch for batch in self.prefetcher]
+        self.assertEqual(batches, [([[0, i]], {'input': i * 10}) for i in (1, 2, 3)])
+        # The end of data is kept for the next calls
+        self.assertRaises(StopIteration, next, self.prefetcher)
+        self.assertRaises(StopIteration, next, self.prefetcher)
+
+    def test_producer_exception(self):
+        def prepare(data_lines):
+            if data_lines[0][1] == 2:
+                raise ValueError('Wrong batch')
+            return self.prepare(data_lines)
+
+        self.prefetcher = DataPrefetcher(get_lines=self.get_lines,
+                                         prepare=prepare,
+                                         nb_batches=3)
+        self.assertEqual(next(self.prefetcher), ([[0, 1]], {'input': 10}))
+        # The exception of the background thread is raised in the caller, and again for the next calls
+        self.assertRaises(ValueError, next, self.prefetcher)
+        self.assertRaises(ValueError, next, self.prefetcher)
+
+    def test_close_full_queue(self):
+        self.prefetcher = DataPrefetcher(get_lines=self.get_lines,
+                                         prepare=self.prepare,
+                                         nb_batches=100,
+                                         queue_size=2,
+                                         on_exit=lambda: self.threads.append(current_thread()))
+        # Wait for the producer to be blocked by the full queue
+        for _ in range(500):
+            if self.counter >= 3:
+                break
+            sleep(0.01)
+        self.assertGreaterEqual(self.counter, 3)
+        self.prefetcher.close(timeout=1.)
+        # The producer stopped without preparing the remaining batches
+        self.assertEqual(len(self.threads), 1)
+        self.assertLess(self.counter, 100)
+
+    def test_thread_handlers(self):
+        self.prefetcher = DataPrefetcher(get_lines=self.get_lines,
+                                         prepare=self.prepare,
+                                         nb_batches=1,
+                                         on_start=lambda: self.threads.append(current_thread()),
+                                         on_exit=lambda: self.threads.append(current_thread()))
+        self.assertEqual(len([batch for batch in self.prefetcher]), 1)
+        self.prefetcher.close(timeout=1.)
+        # Both handlers are called in the background thread
+        self.assertEqual(len(self.threads), 2)
+        for thread in self.threads:
+            self.assertIsNot(thread, main_thread())
@@ -0,0 +1,53 @@
+from unittest import TestCase
+from io import StringIO
+from logging import getLogger, StreamHandler
+from time import sleep
+
+from DeepPhysX.Core.Utils import logger
+from DeepPhysX.Core.Utils.logger import get_logger, configure_logging
+
+
+class TestLogger(TestCase):
+
+    def setUp(self):
+        self.stream = StringIO()
+        self.previous_stream = logger._default_handler.setStream(self.stream)
+        self.handlers = getLogger('DeepPhysX').handlers.copy()
+        # The root logger is not configured by the application
+        self.root_handlers, getLogger().handlers = getLogger().handlers, []
+
+    def tearDown(self):
+        logger._default_handler.setStream(self.previous_stream)
+        getLogger('DeepPhysX').handlers = self.handlers
+        getLogger('DeepPhysX').setLevel('INFO')
+        getLogger().handlers = self.root_handlers
+
+    def test_default_handler(self):
+        # Records are displayed by default
+        get_logger('Component').info('info')
+        get_logger('Component').warning('warning')
+        self.assertEqual(self.stream.getvalue(), 'info\nwarning\n')
+
+    def test_application_handler(self):
+        # Records are only displayed by the application once it configured the root logger
+        root_stream = StringIO()
+        root_handler = StreamHandler(root_stream)
+        getLogger().addHandler(root_handler)
+        try:
+            get_logger('Component').warning('warning')
+        finally:
+            getLogger().removeHandler(root_handler)
+        self.assertEqual(self.stream.getvalue(), '')
+        self.assertEqual(root_stream.getvalue(), 'warning\n')
+
+    def test_configure_logging(self):
+        stream = StringIO()
+        configure_logging(stream=stream, background=True)
+        get_logger('Component').info('info')
+        # Records are written by the background thread, the default handler is replaced
+        for _ in range(100):
+            if stream.getvalue() != '':
+                break
+            sleep(0.01)
+        self.assertEqual(stream.getvalue(), 'info\n')
+        self.assertEqual(self.stream.getvalue(), '')